@@ -7,17 +7,23 @@ Supports multiple languages and voices with streaming audio responses.
 
 import os
 import logging
-import base64
+import pybase64
 import socket
 import asyncpg
-import json
-from typing import List, Optional, Dict, Any
-from io import BytesIO
+import redis.asyncio as aioredis
+import orjson
+import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Response
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from google.cloud import texttospeech
 from google.api_core import exceptions as gcp_exceptions
 from dotenv import load_dotenv
@@ -27,8 +33,6 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize FastAPI app
-
 # Database config
 DB_HOST = os.getenv("PG_HOST", "192.168.31.129")
 DB_PORT = int(os.getenv("PG_PORT", "5435"))
@@ -36,17 +40,64 @@ DB_USER = os.getenv("PG_USER", "postgres")
 DB_PASS = os.getenv("PG_PASS", "postgres")
 DB_NAME = os.getenv("PG_DB", "postgres")
 
-app = FastAPI(
-    title="Google TTS Server",
-    description="Text-to-Speech API using Google Cloud TTS",
-    version="1.0.0",
-)
+# Synthesis cache config (0 bytes = no byte cap)
+CACHE_MAX_ENTRIES = int(os.getenv("TTS_CACHE_MAX_ENTRIES", "256"))
+CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", "0"))
+# Optional Redis second-level cache shared between workers
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_CACHE_TTL = int(os.getenv("REDIS_CACHE_TTL", "86400"))
+# Seconds before a Redis connect/command is abandoned and treated as a miss
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "0.25"))
+VOICES_CACHE_TTL = int(os.getenv("VOICES_CACHE_TTL", "3600"))
+
+# Max concurrent synthesize_speech RPCs to Google; excess requests wait locally
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "32"))
+# Startup warm-up deadline in seconds (kept under the Docker HEALTHCHECK start-period)
+WARMUP_TIMEOUT = float(os.getenv("TTS_WARMUP_TIMEOUT", "4"))
+
+# Activity log queue: records beyond this are dropped rather than buffered
+LOG_QUEUE_MAX = int(os.getenv("LOG_QUEUE_MAX", "10000"))
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", "500"))
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "0.1"))
+
+# Resolved once: neither changes while the process runs
+HOST_NAME = socket.gethostname()
+HAS_GOOGLE_CREDENTIALS = "GOOGLE_APPLICATION_CREDENTIALS" in os.environ
 
 db_pool = None
+tts_client = None
+tts_semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+
+
+async def _init_connection(conn):
+    # jsonb binary wire format is a version byte (1) followed by the JSON text,
+    # so orjson output goes to the server without a str round-trip.
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: b"\x01" + orjson.dumps(value),
+        decoder=lambda data: orjson.loads(data[1:]),
+        schema="pg_catalog",
+        format="binary",
+    )
+
+log_queue: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=LOG_QUEUE_MAX)
+log_dropped = 0
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global db_pool
+    global db_pool, tts_client
+    logger.info(
+        "Registered routes: "
+        + ", ".join(getattr(route, "path", str(route)) for route in app.routes)
+    )
+    # The async client binds its gRPC channel to the running event loop,
+    # so it has to be created here rather than at import time.
+    try:
+        tts_client = texttospeech.TextToSpeechAsyncClient()
+        logger.info("Google TTS client initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize Google TTS client: {e}")
+        tts_client = None
     db_pool = await asyncpg.create_pool(
         host=DB_HOST,
         port=DB_PORT,
@@ -55,21 +106,61 @@ async def lifespan(app: FastAPI):
         database=DB_NAME,
         min_size=1,
         max_size=5,
+        init=_init_connection,
     )
     logger.info(f"Connected to PostgreSQL at {DB_HOST}:{DB_PORT}")
+    if REDIS_URL:
+        synthesis_cache.redis = aioredis.from_url(
+            REDIS_URL,
+            decode_responses=False,
+            socket_timeout=REDIS_TIMEOUT,
+            socket_connect_timeout=REDIS_TIMEOUT,
+        )
+        logger.info("Redis synthesis cache enabled")
+    if tts_client:
+        # Open the gRPC channel and fetch auth tokens now so the first real
+        # request doesn't pay for it; this also primes the /voices cache.
+        # Best-effort and bounded, so a slow Google endpoint can't stall startup.
+        started = time.monotonic()
+        try:
+            voices = await asyncio.wait_for(fetch_supported_voices(), WARMUP_TIMEOUT)
+            logger.info(
+                f"Google TTS client warmed up in {time.monotonic() - started:.3f}s "
+                f"({len(voices)} voices)"
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Google TTS warm-up timed out after {WARMUP_TIMEOUT}s, continuing")
+        except Exception as e:
+            logger.warning(f"Google TTS warm-up failed, continuing: {e}")
+    log_task = asyncio.create_task(_log_flusher())
+    log_task.add_done_callback(_on_log_flusher_done)
     yield
+    try:
+        await asyncio.wait_for(log_queue.join(), timeout=5)
+    except asyncio.TimeoutError:
+        logger.warning(f"Dropping {log_queue.qsize()} pending activity log records on shutdown")
+    log_task.cancel()
+    try:
+        await log_task
+    except asyncio.CancelledError:
+        pass
     if db_pool:
         await db_pool.close()
         logger.info("PostgreSQL pool closed")
+    await synthesis_cache.close()
+    if tts_client:
+        await tts_client.transport.close()
 
+# Initialize FastAPI app
 app = FastAPI(
     title="Google TTS Server",
     description="Text-to-Speech API using Google Cloud TTS",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-async def log_activity(
+def log_activity(
     service_name: str,
     activity_type: str,
     request: dict,
@@ -77,39 +168,200 @@ async def log_activity(
     status: str,
     user: Optional[str] = None,
 ):
-    global db_pool
-    if not db_pool:
-        logger.warning("DB pool not initialized, skipping activity log")
-        return
-    host = socket.gethostname()
+    """Queue an activity log record; the insert happens off the request path."""
+    global log_dropped
     try:
-        # Serialize request/response to JSON string for jsonb columns
-        request_json = json.dumps(request, ensure_ascii=False)
-        response_json = json.dumps(response, ensure_ascii=False)
-        async with db_pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO public.activity_log (service_name, activity_type, request, response, status, "user", host)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                """,
-                service_name,
-                activity_type,
-                request_json,
-                response_json,
-                status,
-                user,
-                host,
-            )
+        log_queue.put_nowait((service_name, activity_type, request, response, status, user))
+    except asyncio.QueueFull:
+        log_dropped += 1
+        if log_dropped == 1 or log_dropped % 1000 == 0:
+            logger.warning(f"Activity log queue full, dropped {log_dropped} records so far")
+
+
+LOG_COLUMNS = ["service_name", "activity_type", "request", "response", "status", "user", "host"]
+
+
+async def _next_log_batch() -> List[tuple]:
+    """Wait for one record, then collect more until the batch is full or the interval expires."""
+    loop = asyncio.get_running_loop()
+    batch = [await log_queue.get()]
+    deadline = loop.time() + LOG_FLUSH_INTERVAL
+    while len(batch) < LOG_BATCH_SIZE:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(log_queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _log_flusher():
+    """Drain the activity log queue into PostgreSQL in COPY batches.
+
+    Holds a single pooled connection for its lifetime instead of
+    acquiring one per record; it is dropped and re-acquired on error.
+    """
+    conn = None
+    try:
+        while True:
+            batch = await _next_log_batch()
+            try:
+                if not db_pool:
+                    logger.warning("DB pool not initialized, skipping activity log")
+                    continue
+                if conn is None:
+                    conn = await db_pool.acquire()
+                # request/response dicts are encoded by the orjson jsonb codec
+                records = [record + (HOST_NAME,) for record in batch]
+                await conn.copy_records_to_table(
+                    "activity_log",
+                    schema_name="public",
+                    records=records,
+                    columns=LOG_COLUMNS,
+                )
+            except Exception as e:
+                logger.error(f"Failed to log activity batch of {len(batch)}: {e}")
+                if conn is not None:
+                    await _release_log_connection(conn)
+                    conn = None
+            finally:
+                for _ in batch:
+                    log_queue.task_done()
+    finally:
+        if conn is not None and db_pool:
+            await _release_log_connection(conn)
+
+
+async def _release_log_connection(conn):
+    """Return the flusher's connection to the pool, terminating it if that fails.
+
+    Pool.release() re-raises when resetting a broken connection fails; that
+    must not escape and kill the flusher.
+    """
+    try:
+        await db_pool.release(conn)
     except Exception as e:
-        logger.error(f"Failed to log activity: {e}")
+        logger.warning(f"Failed to release activity log connection, terminating it: {e}")
+        conn.terminate()
+
+
+def _on_log_flusher_done(task: asyncio.Task):
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error(f"Activity log flusher crashed, activity logging stopped: {error!r}")
+    else:
+        logger.error("Activity log flusher exited, activity logging stopped")
+
+CacheKey = Tuple[str, str, float, float]
+
+
+class SynthesisCache:
+    """LRU cache of synthesized MP3 audio.
+
+    The in-process LRU is the first level. When a Redis client is attached
+    (REDIS_URL), it is a second level shared by all workers; Redis errors
+    and timeouts (REDIS_TIMEOUT) are logged and treated as misses, and
+    writes to Redis happen in the background.
 
-# Initialize Google TTS client
-try:
-    tts_client = texttospeech.TextToSpeechClient()
-    logger.info("Google TTS client initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize Google TTS client: {e}")
-    tts_client = None
+    Local entries are (audio_bytes, audio_base64) tuples; the base64 string
+    is filled in lazily the first time /tts/base64 serves the entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: Optional[int] = None,
+        redis: Optional[aioredis.Redis] = None,
+        redis_ttl: int = 86400,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes or None
+        self.redis = redis
+        self.redis_ttl = redis_ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[bytes, Optional[str]]]" = OrderedDict()
+        self._size = 0
+        self._lock = asyncio.Lock()
+        self._pending: "set[asyncio.Task]" = set()
+
+    @staticmethod
+    def make_key(text: str, voice: str, speed: float, pitch: float) -> CacheKey:
+        # A plain tuple hashes far cheaper than a digest and is exact for an in-process dict
+        return (text, voice, speed, pitch)
+
+    @staticmethod
+    def redis_key(key: CacheKey) -> bytes:
+        # Redis keys need to be short, so the tuple is hashed here. It is
+        # JSON-encoded first so field boundaries can't collide ("a|b", "c" vs "a", "b|c").
+        return b"tts:" + hashlib.blake2b(orjson.dumps(key), digest_size=16).digest()
+
+    async def get(self, key: CacheKey) -> Optional[Tuple[bytes, Optional[str]]]:
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.redis is None:
+            return None
+        try:
+            audio = await self.redis.get(self.redis_key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None
+        if audio is None:
+            return None
+        await self.put_local(key, audio)
+        return (audio, None)
+
+    async def put(self, key: CacheKey, audio: bytes, audio_b64: Optional[str] = None):
+        await self.put_local(key, audio, audio_b64)
+        if self.redis is None:
+            return
+        # The Redis write happens in the background so the response doesn't wait on it
+        task = asyncio.create_task(self._put_redis(self.redis, key, audio))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _put_redis(self, redis: aioredis.Redis, key: CacheKey, audio: bytes):
+        try:
+            await redis.set(self.redis_key(key), audio, ex=self.redis_ttl)
+        except Exception as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    async def close(self):
+        """Finish pending Redis writes and close the Redis client."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def put_local(self, key: CacheKey, audio: bytes, audio_b64: Optional[str] = None):
+        if self.max_entries <= 0:
+            return
+        if self.max_bytes and len(audio) > self.max_bytes:
+            return
+        async with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[0])
+            self._entries[key] = (audio, audio_b64)
+            self._size += len(audio)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes and self._size > self.max_bytes
+            ):
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+synthesis_cache = SynthesisCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    max_bytes=CACHE_MAX_BYTES,
+    redis_ttl=REDIS_CACHE_TTL,
+)
 
 
 class TTSRequest(BaseModel):
@@ -119,17 +371,15 @@ class TTSRequest(BaseModel):
     speed: Optional[float] = Field(1.0, ge=0.25, le=4.0, description="Speech speed (0.25-4.0)")
     pitch: Optional[float] = Field(0.0, ge=-20.0, le=20.0, description="Voice pitch (-20.0 to 20.0)")
 
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate_text_field
+    model_config = ConfigDict(str_strip_whitespace=False)
 
-    @staticmethod
-    def validate_text_field(values):
-        text = values.get('text')
-        if not text or not text.strip():
+    @field_validator('text')
+    @classmethod
+    def validate_text_field(cls, text: str) -> str:
+        text = text.strip()
+        if not text:
             raise ValueError('Text cannot be empty')
-        values['text'] = text.strip()
-        return values
+        return text
 
 
 class VoiceInfo(BaseModel):
@@ -153,6 +403,40 @@ class Base64TTSResponse(BaseModel):
     size: int
 
 
+# Audio larger than this is base64-encoded in a worker thread
+BASE64_THREAD_THRESHOLD = 1024 * 1024
+
+
+async def encode_audio_base64(audio: bytes) -> str:
+    """Base64-encode audio with pybase64's SIMD encoder, off-loop for large payloads."""
+    if len(audio) > BASE64_THREAD_THRESHOLD:
+        return await asyncio.to_thread(pybase64.b64encode_as_string, audio)
+    return pybase64.b64encode_as_string(audio)
+
+
+def base64_audio_response(audio: bytes, audio_b64: str, cache_status: str) -> ORJSONResponse:
+    """Build the /tts/base64 JSON response without a Base64TTSResponse round-trip."""
+    return ORJSONResponse(
+        {
+            "audio_base64": audio_b64,
+            "content_type": "audio/mpeg",
+            "size": len(audio),
+        },
+        headers={"X-Cache": cache_status},
+    )
+
+
+def log_request_payload(request: TTSRequest) -> Dict[str, Any]:
+    """Summarize a TTS request for the activity log without the full text."""
+    return {
+        "text_len": len(request.text),
+        "voice": request.voice,
+        "speed": request.speed,
+        "pitch": request.pitch,
+    }
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_language_code(voice_name: str) -> str:
     """Extract language code from voice name."""
     # Voice names typically follow pattern: "en-US-Wavenet-A"
@@ -162,48 +446,96 @@ def extract_language_code(voice_name: str) -> str:
     return "en-US"  # fallback
 
 
-def get_supported_voices() -> List[VoiceInfo]:
+@functools.lru_cache(maxsize=256)
+def build_voice_params(voice_name: str) -> texttospeech.VoiceSelectionParams:
+    """Build (and reuse) the voice selection message for a voice name.
+
+    The returned message is shared between requests and must not be mutated.
+    """
+    return texttospeech.VoiceSelectionParams(
+        language_code=extract_language_code(voice_name),
+        name=voice_name,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def build_audio_config(speed: float, pitch: float) -> texttospeech.AudioConfig:
+    """Build (and reuse) the MP3 audio config for a speed/pitch pair.
+
+    The returned message is shared between requests and must not be mutated.
+    """
+    return texttospeech.AudioConfig(
+        audio_encoding=texttospeech.AudioEncoding.MP3,
+        speaking_rate=speed,
+        pitch=pitch,
+    )
+
+
+_voices_cache: Tuple[float, List[VoiceInfo]] = (0.0, [])
+
+
+async def fetch_supported_voices() -> List[VoiceInfo]:
+    """Fetch voices for RU, HE, EN from Google and refresh the cache.
+
+    Raises on API errors; get_supported_voices() is the forgiving wrapper.
+    """
+    global _voices_cache
+    # List available voices from Google
+    voices_response = await tts_client.list_voices()
+    supported_languages = ["en", "ru", "he"]
+    filtered_voices = []
+
+    for voice in voices_response.voices:
+        for language_code in voice.language_codes:
+            # Check if voice supports any of our target languages
+            lang_prefix = language_code.split('-')[0].lower()
+            if lang_prefix in supported_languages:
+                filtered_voices.append(VoiceInfo(
+                    name=voice.name,
+                    language_code=language_code,
+                    gender=voice.ssml_gender.name,
+                    natural_sample_rate=voice.natural_sample_rate_hertz
+                ))
+                break
+
+    if filtered_voices:
+        _voices_cache = (time.monotonic(), filtered_voices)
+    return filtered_voices
+
+
+async def get_supported_voices() -> List[VoiceInfo]:
     """Get list of supported voices for RU, HE, EN languages."""
     if not tts_client:
         return []
-    
+
+    cached_at, cached_voices = _voices_cache
+    if cached_voices and time.monotonic() - cached_at < VOICES_CACHE_TTL:
+        return cached_voices
+
     try:
-        # List available voices from Google
-        voices_response = tts_client.list_voices()
-        supported_languages = ["en", "ru", "he"]
-        filtered_voices = []
-        
-        for voice in voices_response.voices:
-            for language_code in voice.language_codes:
-                # Check if voice supports any of our target languages
-                lang_prefix = language_code.split('-')[0].lower()
-                if lang_prefix in supported_languages:
-                    filtered_voices.append(VoiceInfo(
-                        name=voice.name,
-                        language_code=language_code,
-                        gender=voice.ssml_gender.name,
-                        natural_sample_rate=voice.natural_sample_rate_hertz
-                    ))
-                    break
-        
-        return filtered_voices
+        return await fetch_supported_voices()
     except Exception as e:
         logger.error(f"Failed to fetch voices: {e}")
         return []
 
 
-@app.get("/", response_model=Dict[str, str])
+# The root payload never changes, so it is encoded once at import
+ROOT_RESPONSE = orjson.dumps({
+    "message": "Google TTS Server",
+    "version": "1.0.0",
+    "endpoints": {
+        "tts": "POST /tts - Text to speech synthesis",
+        "tts_stream": "POST /tts/stream - Streaming text to speech (Chirp 3 HD voices)",
+        "voices": "GET /voices - List available voices",
+        "health": "GET /health - Health check"
+    }
+})
+
+
+@app.get("/", response_model=Dict[str, Any])
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Google TTS Server",
-        "version": "1.0.0",
-        "endpoints": {
-            "tts": "POST /tts - Text to speech synthesis",
-            "voices": "GET /voices - List available voices",
-            "health": "GET /health - Health check"
-        }
-    }
+    return Response(content=ROOT_RESPONSE, media_type="application/json")
 
 
 @app.get("/health")
@@ -215,7 +547,7 @@ async def health_check():
     return {
         "status": "healthy",
         "tts_client": "connected",
-        "google_credentials": "GOOGLE_APPLICATION_CREDENTIALS" in os.environ
+        "google_credentials": HAS_GOOGLE_CREDENTIALS
     }
 
 
@@ -229,7 +561,7 @@ async def list_voices():
         )
     
     try:
-        voices = get_supported_voices()
+        voices = await get_supported_voices()
         if not voices:
             logger.warning("No voices found for supported languages")
         return voices
@@ -244,57 +576,69 @@ async def list_voices():
 @app.post("/tts")
 async def synthesize_speech(request: TTSRequest):
     """
-    Synthesize text to speech and return audio stream.
+    Synthesize text to speech and return MP3 audio.
     
-    Returns MP3 audio file as streaming response.
+    The audio is already fully buffered, so it is sent as a plain
+    Response (Content-Length is set by Starlette) rather than streamed.
     """
     if not tts_client:
         raise HTTPException(
             status_code=503,
             detail="TTS client not initialized. Check Google Cloud credentials."
         )
+
+    req_payload = log_request_payload(request)
     
+    cache_key = SynthesisCache.make_key(request.text, request.voice, request.speed, request.pitch)
+    cached = await synthesis_cache.get(cache_key)
+    if cached is not None:
+        audio_content = cached[0]
+        log_activity(
+            service_name="tts-server",
+            activity_type="tts",
+            request=req_payload,
+            response={"size": len(audio_content), "cache": "hit"},
+            status="success",
+        )
+        return Response(
+            content=audio_content,
+            media_type="audio/mpeg",
+            headers={
+                "Content-Disposition": "attachment; filename=speech.mp3",
+                "X-Cache": "HIT",
+            }
+        )
+
     try:
-        # Extract language code from voice name
-        language_code = extract_language_code(request.voice)
-        
         # Configure synthesis input
         synthesis_input = texttospeech.SynthesisInput(text=request.text)
         
-        # Configure voice parameters
-        voice_params = texttospeech.VoiceSelectionParams(
-            language_code=language_code,
-            name=request.voice,
-        )
-        
-        # Configure audio output
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=request.speed,
-            pitch=request.pitch,
-        )
+        # Voice and audio output parameters are shared across requests
+        voice_params = build_voice_params(request.voice)
+        audio_config = build_audio_config(request.speed, request.pitch)
         
         # Perform TTS synthesis
         logger.info(f"Synthesizing text: '{request.text[:50]}...' with voice: {request.voice}")
-        response = tts_client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice_params,
-            audio_config=audio_config
-        )
-        audio_stream = BytesIO(response.audio_content)
-        result = StreamingResponse(
-            BytesIO(response.audio_content),
+        async with tts_semaphore:
+            response = await tts_client.synthesize_speech(
+                input=synthesis_input,
+                voice=voice_params,
+                audio_config=audio_config,
+            )
+        await synthesis_cache.put(cache_key, response.audio_content)
+        result = Response(
+            content=response.audio_content,
             media_type="audio/mpeg",
             headers={
                 "Content-Disposition": "attachment; filename=speech.mp3",
-                "Content-Length": str(len(response.audio_content))
+                "X-Cache": "MISS",
             }
         )
         # Log activity
-        await log_activity(
+        log_activity(
             service_name="tts-server",
             activity_type="tts",
-            request=request.dict(),
+            request=req_payload,
             response={"size": len(response.audio_content)},
             status="success",
         )
@@ -302,42 +646,44 @@ async def synthesize_speech(request: TTSRequest):
         
     except gcp_exceptions.InvalidArgument as e:
         logger.error(f"Invalid argument error: {e}")
-        await log_activity(
+        log_activity(
             service_name="tts-server",
             activity_type="tts",
-            request=request.dict(),
+            request=req_payload,
             response={"error": str(e)},
             status="invalid_argument",
         )
         raise HTTPException(status_code=400, detail=f"Invalid voice or parameters: {e}")
     except gcp_exceptions.GoogleAPICallError as e:
         logger.error(f"Google API call error: {e}")
-        await log_activity(
+        log_activity(
             service_name="tts-server",
             activity_type="tts",
-            request=request.dict(),
+            request=req_payload,
             response={"error": str(e)},
             status="api_error",
         )
         raise HTTPException(status_code=503, detail=f"Google TTS API error: {e}")
     except Exception as e:
         logger.error(f"Unexpected error during synthesis: {e}")
-        await log_activity(
+        log_activity(
             service_name="tts-server",
             activity_type="tts",
-            request=request.dict(),
+            request=req_payload,
             response={"error": str(e)},
             status="error",
         )
         raise HTTPException(status_code=500, detail="Text-to-speech synthesis failed")
 
 
-@app.post("/tts/base64", response_model=Base64TTSResponse)
+@app.post("/tts/base64", response_model=Base64TTSResponse, response_class=ORJSONResponse)
 async def synthesize_speech_base64(request: TTSRequest):
     """
     Synthesize text to speech and return audio as base64 string.
 
     Returns JSON with fields: audio_base64, content_type, size.
+    Base64TTSResponse only documents the schema; the body is encoded
+    straight from a dict to skip re-validating the large base64 string.
     """
     if not tts_client:
         raise HTTPException(
@@ -345,41 +691,46 @@ async def synthesize_speech_base64(request: TTSRequest):
             detail="TTS client not initialized. Check Google Cloud credentials."
         )
 
-    try:
-        language_code = extract_language_code(request.voice)
-
-        synthesis_input = texttospeech.SynthesisInput(text=request.text)
+    req_payload = log_request_payload(request)
 
-        voice_params = texttospeech.VoiceSelectionParams(
-            language_code=language_code,
-            name=request.voice,
+    cache_key = SynthesisCache.make_key(request.text, request.voice, request.speed, request.pitch)
+    cached = await synthesis_cache.get(cache_key)
+    if cached is not None:
+        audio_bytes, audio_b64 = cached
+        if audio_b64 is None:
+            audio_b64 = await encode_audio_base64(audio_bytes)
+            await synthesis_cache.put_local(cache_key, audio_bytes, audio_b64)
+        log_activity(
+            service_name="tts-server",
+            activity_type="tts_base64",
+            request=req_payload,
+            response={"size": len(audio_bytes), "cache": "hit"},
+            status="success",
         )
+        return base64_audio_response(audio_bytes, audio_b64, cache_status="HIT")
 
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=request.speed,
-            pitch=request.pitch,
-        )
+    try:
+        synthesis_input = texttospeech.SynthesisInput(text=request.text)
+        voice_params = build_voice_params(request.voice)
+        audio_config = build_audio_config(request.speed, request.pitch)
 
         logger.info(
             f"Synthesizing (base64) text: '{request.text[:50]}...' with voice: {request.voice}"
         )
-        response = tts_client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice_params,
-            audio_config=audio_config,
-        )
+        async with tts_semaphore:
+            response = await tts_client.synthesize_speech(
+                input=synthesis_input,
+                voice=voice_params,
+                audio_config=audio_config,
+            )
         audio_bytes = response.audio_content
-        audio_b64 = base64.b64encode(audio_bytes).decode("ascii")
-        result = Base64TTSResponse(
-            audio_base64=audio_b64,
-            content_type="audio/mpeg",
-            size=len(audio_bytes),
-        )
-        await log_activity(
+        audio_b64 = await encode_audio_base64(audio_bytes)
+        await synthesis_cache.put(cache_key, audio_bytes, audio_b64)
+        result = base64_audio_response(audio_bytes, audio_b64, cache_status="MISS")
+        log_activity(
             service_name="tts-server",
             activity_type="tts_base64",
-            request=request.dict(),
+            request=req_payload,
             response={"size": len(audio_bytes)},
             status="success",
         )
@@ -387,36 +738,170 @@ async def synthesize_speech_base64(request: TTSRequest):
 
     except gcp_exceptions.InvalidArgument as e:
         logger.error(f"Invalid argument error (base64): {e}")
-        await log_activity(
+        log_activity(
             service_name="tts-server",
             activity_type="tts_base64",
-            request=request.dict(),
+            request=req_payload,
             response={"error": str(e)},
             status="invalid_argument",
         )
         raise HTTPException(status_code=400, detail=f"Invalid voice or parameters: {e}")
     except gcp_exceptions.GoogleAPICallError as e:
         logger.error(f"Google API call error (base64): {e}")
-        await log_activity(
+        log_activity(
             service_name="tts-server",
             activity_type="tts_base64",
-            request=request.dict(),
+            request=req_payload,
             response={"error": str(e)},
             status="api_error",
         )
         raise HTTPException(status_code=503, detail=f"Google TTS API error: {e}")
     except Exception as e:
         logger.error(f"Unexpected error during base64 synthesis: {e}")
-        await log_activity(
+        log_activity(
             service_name="tts-server",
             activity_type="tts_base64",
-            request=request.dict(),
+            request=req_payload,
             response={"error": str(e)},
             status="error",
         )
         raise HTTPException(status_code=500, detail="Text-to-speech base64 synthesis failed")
 
 
+@app.post("/tts/stream")
+async def synthesize_speech_stream(request: TTSRequest):
+    """
+    Synthesize text to speech and stream audio as Google produces it.
+
+    Uses Google's streaming synthesis, which only supports Chirp 3 HD voices,
+    OGG/Opus output and speeds of 0.25-2.0; pitch is not supported.
+    Returns OGG/Opus audio as a chunked streaming response.
+    """
+    if not tts_client:
+        raise HTTPException(
+            status_code=503,
+            detail="TTS client not initialized. Check Google Cloud credentials."
+        )
+
+    req_payload = log_request_payload(request)
+    if request.pitch:
+        raise HTTPException(status_code=400, detail="Pitch is not supported for streaming synthesis")
+    speed = 1.0 if request.speed is None else request.speed
+    if not 0.25 <= speed <= 2.0:
+        raise HTTPException(status_code=400, detail="Speed must be 0.25-2.0 for streaming synthesis")
+
+    streaming_config = texttospeech.StreamingSynthesizeConfig(
+        voice=build_voice_params(request.voice),
+        streaming_audio_config=texttospeech.StreamingAudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.OGG_OPUS,
+            speaking_rate=speed,
+        ),
+    )
+
+    async def request_generator():
+        yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
+        yield texttospeech.StreamingSynthesizeRequest(
+            input=texttospeech.StreamingSynthesisInput(text=request.text)
+        )
+
+    logger.info(
+        f"Synthesizing (stream) text: '{request.text[:50]}...' with voice: {request.voice}"
+    )
+    # The semaphore slot is held for the whole RPC. It is given back exactly once,
+    # by audio_chunks() finishing or by the response's background task, which
+    # Starlette still runs when the client disconnects before the body starts.
+    stream = None
+    released = False
+
+    async def release_stream():
+        nonlocal released
+        if released:
+            return
+        released = True
+        if stream is not None:
+            stream.cancel()
+        tts_semaphore.release()
+
+    await tts_semaphore.acquire()
+    try:
+        try:
+            # Pull the first chunk up front so API errors still map to HTTP status codes
+            stream = await tts_client.streaming_synthesize(requests=request_generator())
+            chunks = stream.__aiter__()
+            try:
+                first_chunk = (await chunks.__anext__()).audio_content
+            except StopAsyncIteration:
+                first_chunk = b""
+        except BaseException:
+            await release_stream()
+            raise
+    except gcp_exceptions.InvalidArgument as e:
+        logger.error(f"Invalid argument error (stream): {e}")
+        log_activity(
+            service_name="tts-server",
+            activity_type="tts_stream",
+            request=req_payload,
+            response={"error": str(e)},
+            status="invalid_argument",
+        )
+        raise HTTPException(status_code=400, detail=f"Invalid voice or parameters: {e}")
+    except gcp_exceptions.GoogleAPICallError as e:
+        logger.error(f"Google API call error (stream): {e}")
+        log_activity(
+            service_name="tts-server",
+            activity_type="tts_stream",
+            request=req_payload,
+            response={"error": str(e)},
+            status="api_error",
+        )
+        raise HTTPException(status_code=503, detail=f"Google TTS API error: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error during streaming synthesis: {e}")
+        log_activity(
+            service_name="tts-server",
+            activity_type="tts_stream",
+            request=req_payload,
+            response={"error": str(e)},
+            status="error",
+        )
+        raise HTTPException(status_code=500, detail="Text-to-speech streaming synthesis failed")
+
+    async def audio_chunks():
+        size = len(first_chunk)
+        try:
+            if first_chunk:
+                yield first_chunk
+            async for chunk in chunks:
+                size += len(chunk.audio_content)
+                yield chunk.audio_content
+            log_activity(
+                service_name="tts-server",
+                activity_type="tts_stream",
+                request=req_payload,
+                response={"size": size},
+                status="success",
+            )
+        except Exception as e:
+            # Headers are already sent, so the client just sees a truncated stream
+            logger.error(f"Error while streaming synthesis: {e}")
+            log_activity(
+                service_name="tts-server",
+                activity_type="tts_stream",
+                request=req_payload,
+                response={"error": str(e), "size": size},
+                status="error",
+            )
+            raise
+        finally:
+            await release_stream()
+
+    return StreamingResponse(
+        audio_chunks(),
+        media_type="audio/ogg",
+        background=BackgroundTask(release_stream),
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -427,10 +912,14 @@ if __name__ == "__main__":
             "Make sure to set this environment variable to your service account key path."
         )
     
+    # Each worker has its own TTS client, DB pool and local cache; set
+    # REDIS_URL to share cached audio between them.
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=3010,
-        reload=True,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
\ No newline at end of file